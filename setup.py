@@ -29,7 +29,13 @@ setup(
     ],
     python_requires=">=3.7.*,<=3.12.*",
     install_requires=[
+        "cachetools",
         "requests",
+        "urllib3>=1.26",
     ],
+    extras_require={
+        "async": ["httpx[http2]"],
+        "orjson": ["orjson"],
+    },
     include_package_data=True,
 )
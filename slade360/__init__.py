@@ -1,6 +1,24 @@
-from slade360.api import Slade360
+from slade360.api import AsyncSlade360, Slade360
+from slade360.exceptions import (
+    BulkSubmissionError,
+    ClaimSubmissionError,
+    FailedChild,
+    FailedClaim,
+)
 from slade360.wrappers.post_visit import Remittance
 from slade360.wrappers.start_visits import Visit
 from slade360.wrappers.submit_visits import Claim, CreditNote, Invoice
 
-__all__ = ["Slade360", "Remittance", "Visit", "Claim", "CreditNote", "Invoice"]
+__all__ = [
+    "Slade360",
+    "AsyncSlade360",
+    "Remittance",
+    "Visit",
+    "Claim",
+    "CreditNote",
+    "Invoice",
+    "ClaimSubmissionError",
+    "FailedChild",
+    "BulkSubmissionError",
+    "FailedClaim",
+]
@@ -1,25 +1,116 @@
-import logging
+import asyncio
+import itertools
+import math
 import os
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor
-from queue import Queue
-from threading import Thread
-from typing import Any, Callable, Deque, Dict, List, Tuple
+import threading
+from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 
+from slade360.exceptions import (
+    BulkSubmissionError,
+    ClaimSubmissionError,
+    FailedChild,
+    FailedClaim,
+)
+from slade360.wrappers import DEFAULT_POOL_MAXSIZE, Authentication
+from slade360.wrappers._async import (
+    AsyncAuthentication,
+    AsyncClaim,
+    AsyncCreditNote,
+    AsyncInvoice,
+)
 from slade360.wrappers.post_visit import Remittance
 from slade360.wrappers.start_visits import Visit
 from slade360.wrappers.submit_visits import Claim, CreditNote, Invoice
 
 DEFAULT_NUM_OF_WORKERS = os.cpu_count() or 4
-LOGGER = logging.getLogger(__name__)
+# Payer groups scheduled per worker when sending in bulk, enough to keep every
+# worker busy. This only limits scheduling: all groups are built up front.
+IN_FLIGHT_GROUPS_PER_WORKER = 2
 
+# Round-robin over the cores this process may run on, shared by all pools
+_CORE_CYCLE: Optional[Iterator[int]] = None
+_CORE_CYCLE_LOCK = threading.Lock()
 
-class Slade360(Visit, Claim, Invoice, CreditNote, Remittance):
+
+def _pin_worker() -> None:
+    """
+    Pins the calling worker thread to a single core, chosen round-robin.
+
+    Used as a `ThreadPoolExecutor` initializer so that each worker keeps its
+    session state in one core's cache. A no-op where CPU affinity is not
+    supported (e.g. macOS and Windows).
+    """
+    global _CORE_CYCLE
+
+    if not hasattr(os, "sched_setaffinity"):
+        return
+
+    with _CORE_CYCLE_LOCK:
+        if _CORE_CYCLE is None:
+            _CORE_CYCLE = itertools.cycle(sorted(os.sched_getaffinity(0)))
+        core = next(_CORE_CYCLE)
+
+    try:
+        # On Linux, pid 0 targets the calling thread only
+        os.sched_setaffinity(0, {core})
+    except OSError:
+        pass
+
+
+class Slade360(Visit, Claim, Invoice, CreditNote, Remittance, Authentication):
     """
     A class that handles the API interactions with Slade360 (edi.slade360.co.ke)
     for claims, invoices, credit notes, and remittances.
+
+    The resource classes are mixins; `Authentication`, listed last, provides
+    the authenticated session they all share.
     """
 
+    def __init__(
+        self,
+        *args,
+        num_of_workers=DEFAULT_NUM_OF_WORKERS,
+        pin_workers: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        Authenticates and sets up the worker pool used to upload the children
+        (invoices, credit notes and attachments) of each claim.
+
+        :param num_of_workers: Number of threads in the attachment pool
+            (default: set by DEFAULT_NUM_OF_WORKERS).
+        :param pin_workers: Pin each worker thread to one CPU core, round-robin
+            (Linux only; default is False). Can help on hosts with many cores.
+
+        All other arguments are passed on to `Authentication`.
+        """
+        kwargs.setdefault("pool_maxsize", max(DEFAULT_POOL_MAXSIZE, num_of_workers * 4))
+        super().__init__(*args, **kwargs)
+        self._worker_initializer: Optional[Callable[[], None]] = (
+            _pin_worker if pin_workers else None
+        )
+        self._attachment_pool = ThreadPoolExecutor(
+            max_workers=num_of_workers,
+            thread_name_prefix="slade-att",
+            initializer=self._worker_initializer,
+        )
+
+    def close(self) -> None:
+        """
+        Waits for pending uploads to finish, then releases the worker pool
+        and the HTTP session.
+        """
+        self._attachment_pool.shutdown(wait=True)
+        super().close()
+
     def send_claims_in_bulk(
         self,
         bundled_claims: List[Dict[str, Any]],
@@ -39,105 +130,384 @@ class Slade360(Visit, Claim, Invoice, CreditNote, Remittance):
         - credit_notes: A list of credit notes linked to the claim.
         - claim_attachments: Attachments related to the claim (e.g., prescription, preauth form).
 
+        Claims are grouped by `payer_code` and each group is sent sequentially by
+        one worker, so one future is scheduled per group rather than per claim;
+        large payers are split across several groups so that every worker stays
+        busy. Only `IN_FLIGHT_GROUPS_PER_WORKER * num_of_workers` groups are
+        scheduled at any one time. As the groups are all built up front, this
+        limits scheduling only and does not bound memory. Failing claims do not
+        stop the others: every claim is attempted before the failures are raised
+        together.
+
         Usage:
         >>> self.send_claims_in_bulk(bundled_claims)
+
+        :raises BulkSubmissionError: Listing every claim that was not submitted in
+            full. Should a worker fail outright, every claim in its group is listed.
         """
-        with ThreadPoolExecutor(max_workers=num_of_workers) as executor:
-            executor.map(self.send_a_claim_and_its_children, bundled_claims)
+        claim_groups = self._group_claims_by_payer(bundled_claims, num_of_workers)
+        if not claim_groups:
+            return
+
+        groups = iter(claim_groups)
+        in_flight: Dict[Future, List[Dict[str, Any]]] = {}
+        failures: List[FailedClaim] = []
 
-    def _worker(self, queue: Queue) -> None:
-        while True:
-            task = queue.get()
-            if task is None:
-                break
+        with ThreadPoolExecutor(
+            max_workers=min(num_of_workers, len(claim_groups)),
+            thread_name_prefix="slade-bulk",
+            initializer=self._worker_initializer,
+        ) as executor:
 
-            func, args = task
+            def submit_next() -> None:
+                claim_group = next(groups, None)
+                if claim_group is not None:
+                    future = executor.submit(self._send_claim_group, claim_group)
+                    in_flight[future] = claim_group
+
+            for _ in range(IN_FLIGHT_GROUPS_PER_WORKER * num_of_workers):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    claim_group = in_flight.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        failures.extend(future.result())
+                    else:
+                        # How far the group got is unknown, so report all of it
+                        failures.extend(
+                            FailedClaim(bundled_claim, error)
+                            for bundled_claim in claim_group
+                        )
+                    submit_next()
+
+        if failures:
+            raise BulkSubmissionError(failures) from failures[0].error
+
+    @staticmethod
+    def _group_claims_by_payer(
+        bundled_claims: List[Dict[str, Any]], num_of_workers: int
+    ) -> List[List[Dict[str, Any]]]:
+        by_payer: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+        for bundled_claim in bundled_claims:
+            by_payer[bundled_claim.get("payer_code")].append(bundled_claim)
+
+        # Cap the group size so a single large payer still spreads over all workers
+        group_size = max(1, math.ceil(len(bundled_claims) / num_of_workers))
+        return [
+            payer_claims[start : start + group_size]
+            for payer_claims in by_payer.values()
+            for start in range(0, len(payer_claims), group_size)
+        ]
+
+    def _send_claim_group(self, claim_group: List[Dict[str, Any]]) -> List[FailedClaim]:
+        failures = []
+        for bundled_claim in claim_group:
             try:
-                func(*args)
+                # Sending pops the children, so keep the caller's bundle intact
+                self.send_a_claim_and_its_children(dict(bundled_claim))
             except Exception as e:
-                LOGGER.error(f"Error processing task: {e}")
-            finally:
-                queue.task_done()
+                failures.append(FailedClaim(bundled_claim, e))
+        return failures
 
-    def _process_tasks(
-        self, tasks: Deque[Tuple[Callable, Tuple]], num_workers=DEFAULT_NUM_OF_WORKERS
+    def _collect_failures(self, futures: List[Future]) -> List[FailedChild]:
+        wait(futures)
+        return [failure for future in futures for failure in future.result()]
+
+    def _submit_claim_attachments_batch(
+        self, claim_id: str, claim_attachments: List[Dict[str, Any]]
+    ) -> List[FailedChild]:
+        failures = []
+        for attachment in claim_attachments:
+            try:
+                self.submit_claim_attachment(
+                    claim_id,
+                    attachment["path_to_attachment"],
+                    attachment["attachment_type"],
+                    attachment.get("description"),
+                )
+            except Exception as e:
+                failures.append(
+                    FailedChild("claim_attachment", claim_id, attachment, e)
+                )
+        return failures
+
+    def _submit_invoice_attachments_batch(
+        self, inv_id: str, invoice_attachments: List[Dict[str, Any]]
+    ) -> List[FailedChild]:
+        failures = []
+        for inv_attachment in invoice_attachments:
+            try:
+                self.submit_invoice_attachment(
+                    inv_id,
+                    inv_attachment["path_to_attachment"],
+                    inv_attachment.get("description", ""),
+                )
+            except Exception as e:
+                failures.append(
+                    FailedChild("invoice_attachment", inv_id, inv_attachment, e)
+                )
+        return failures
+
+    def _process_claim_attachments(
+        self,
+        claim_attachments: List[Dict[str, Any]],
+        futures: List[Future],
+        claim_id: str,
     ) -> None:
-        queue = Queue()
-        threads: List[Thread] = []
+        # One task per claim rather than per file keeps scheduling overhead low
+        if claim_attachments:
+            futures.append(
+                self._attachment_pool.submit(
+                    self._submit_claim_attachments_batch, claim_id, claim_attachments
+                )
+            )
 
-        for _ in range(num_workers):
-            t = Thread(target=self._worker, args=(queue,))
-            t.start()
-            threads.append(t)
+    def _process_invoice_attachments(
+        self,
+        invoice_attachments: List[Dict[str, Any]],
+        futures: List[Future],
+        inv_id: str,
+    ) -> None:
+        if invoice_attachments:
+            futures.append(
+                self._attachment_pool.submit(
+                    self._submit_invoice_attachments_batch, inv_id, invoice_attachments
+                )
+            )
 
-        for task in tasks:
-            queue.put(task)
+    def _process_invoices(
+        self, invoices: List[Dict[str, Any]], claim_id: str
+    ) -> Dict[Future, Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]:
+        pending = {}
+        for invoice in invoices:
+            fields = {
+                key: value
+                for key, value in invoice.items()
+                if key != "invoice_attachments"
+            }
+            future = self._attachment_pool.submit(
+                self.submit_invoices, claim=claim_id, **fields
+            )
+            pending[future] = (
+                "invoice",
+                invoice,
+                invoice.get("invoice_attachments", []),
+            )
+        return pending
 
-        queue.join()
+    def _process_credit_notes(
+        self, credit_notes: List[Dict[str, Any]], claim_id: str
+    ) -> Dict[Future, Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]:
+        pending = {}
+        for crn in credit_notes:
+            fields = {
+                key: value for key, value in crn.items() if key != "crn_attachments"
+            }
+            future = self._attachment_pool.submit(
+                self.submit_credit_note, claim_id, **fields
+            )
+            pending[future] = ("credit_note", crn, crn.get("crn_attachments", []))
+        return pending
 
-        for _ in range(num_workers):
-            queue.put(None)
+    def send_a_claim_and_its_children(self, bundled_claim: Dict[str, Any]) -> None:
+        """
+        Sends an individual claim, along with its invoices, credit notes, and attachments.
 
-        for t in threads:
-            t.join()
+        Invoices and credit notes are submitted concurrently once the claim exists,
+        and each one's attachments are queued as soon as it has been created.
 
-    def _process_claim_attachments(
-        self, claim_attachments: List[Dict[str, Any]], tasks: Deque, claim_id: str
+        :param bundled_claim: A dictionary containing the claim,
+            its invoices, credit notes, and related attachments.
+        :raises ClaimSubmissionError: If the claim was created but any of its
+            children failed; every other child is still submitted.
+        """
+        invoices: List[Dict[str, Any]] = bundled_claim.pop("invoices", [])
+        claim_attachments: List[Dict[str, Any]] = bundled_claim.pop(
+            "claim_attachments", []
+        )
+        credit_notes: List[Dict[str, Any]] = bundled_claim.pop("credit_notes", [])
+
+        claim_resp = self.create_claim(**bundled_claim)
+        claim_id = claim_resp["id"]
+
+        futures: List[Future] = []
+        self._process_claim_attachments(claim_attachments, futures, claim_id)
+
+        pending = self._process_invoices(invoices, claim_id)
+        pending.update(self._process_credit_notes(credit_notes, claim_id))
+
+        failures: List[FailedChild] = []
+        for future in as_completed(pending):
+            kind, child, attachments = pending[future]
+            try:
+                inv_id = future.result()["id"]
+            except Exception as e:
+                failures.append(FailedChild(kind, claim_id, child, e))
+                continue
+            self._process_invoice_attachments(attachments, futures, inv_id)
+
+        failures.extend(self._collect_failures(futures))
+        if failures:
+            raise ClaimSubmissionError(claim_id, failures) from failures[0].error
+
+
+class AsyncSlade360(AsyncClaim, AsyncInvoice, AsyncCreditNote, AsyncAuthentication):
+    """
+    asyncio counterpart of `Slade360` for bulk claim submission.
+
+    All requests share one HTTP/2 `httpx.AsyncClient` on a single event loop,
+    so hundreds of uploads can be in flight without a thread per request, all
+    multiplexed over one connection per host.
+    Requires the `async` extra (`pip install slade360[async]`).
+    """
+
+    def send_claims_in_bulk(
+        self,
+        bundled_claims: List[Dict[str, Any]],
+        num_of_workers=DEFAULT_NUM_OF_WORKERS,
     ) -> None:
-        for attachment in claim_attachments:
-            tasks.append(
-                (
-                    self.submit_claim_attachment,
-                    (
+        """
+        Synchronous entry point for `asend_claims_in_bulk`.
+
+        Opens the client, sends the claims on a fresh event loop and closes the
+        client again. Must not be called from a running event loop.
+
+        :param bundled_claims: A list of claims, as for `Slade360.send_claims_in_bulk`.
+        :param num_of_workers: Maximum number of claims being sent at once
+            (default: set by DEFAULT_NUM_OF_WORKERS).
+        """
+
+        async def run() -> None:
+            async with self:
+                await self.asend_claims_in_bulk(bundled_claims, num_of_workers)
+
+        asyncio.run(run())
+
+    async def asend_claims_in_bulk(
+        self,
+        bundled_claims: List[Dict[str, Any]],
+        num_of_workers=DEFAULT_NUM_OF_WORKERS,
+    ) -> None:
+        """
+        Sends claims, invoices, and related attachments in bulk.
+
+        :param bundled_claims: A list of claims, as for `Slade360.send_claims_in_bulk`.
+        :param num_of_workers: Maximum number of claims being sent at once
+            (default: set by DEFAULT_NUM_OF_WORKERS).
+        :raises BulkSubmissionError: Once every claim has been attempted, listing
+            each one that was not submitted in full.
+        """
+        semaphore = asyncio.Semaphore(num_of_workers)
+
+        async def send(bundled_claim: Dict[str, Any]) -> None:
+            async with semaphore:
+                # Sending pops the children, so keep the caller's bundle intact
+                await self.asend_a_claim_and_its_children(dict(bundled_claim))
+
+        # Collect errors rather than let the first one cancel the other claims
+        results = await asyncio.gather(
+            *(send(bundled_claim) for bundled_claim in bundled_claims),
+            return_exceptions=True,
+        )
+        failures = [
+            FailedClaim(bundled_claim, result)
+            for bundled_claim, result in zip(bundled_claims, results)
+            if isinstance(result, BaseException)
+        ]
+        if failures:
+            raise BulkSubmissionError(failures) from failures[0].error
+
+    async def _asubmit_child(
+        self, kind: str, parent_id: str, child: Dict[str, Any], submission: Awaitable
+    ) -> List[FailedChild]:
+        try:
+            await submission
+        except Exception as e:
+            return [FailedChild(kind, parent_id, child, e)]
+        return []
+
+    async def _asubmit_claim_attachments(
+        self, claim_id: str, claim_attachments: List[Dict[str, Any]]
+    ) -> List[FailedChild]:
+        results = await asyncio.gather(
+            *(
+                self._asubmit_child(
+                    "claim_attachment",
+                    claim_id,
+                    attachment,
+                    self.asubmit_claim_attachment(
                         claim_id,
                         attachment["path_to_attachment"],
                         attachment["attachment_type"],
                         attachment.get("description"),
                     ),
                 )
+                for attachment in claim_attachments
             )
+        )
+        return [failure for result in results for failure in result]
 
-    def _process_invoices(
-        self, invoices: List[Dict[str, Any]], tasks: Deque, claim_id: str
-    ) -> None:
-        for invoice in invoices:
-            inv_response = self.submit_invoices(claim=claim_id, **invoice)
-            inv_id = inv_response["id"]
-            for inv_attachment in invoice.get("invoice_attachments", []):
-                tasks.append(
-                    (
-                        self.submit_invoice_attachment,
-                        (
-                            inv_id,
-                            inv_attachment["path_to_attachment"],
-                            inv_attachment.get("description", ""),
-                        ),
-                    )
+    async def _asubmit_invoice_attachments(
+        self, inv_id: str, invoice_attachments: List[Dict[str, Any]]
+    ) -> List[FailedChild]:
+        results = await asyncio.gather(
+            *(
+                self._asubmit_child(
+                    "invoice_attachment",
+                    inv_id,
+                    inv_attachment,
+                    self.asubmit_invoice_attachment(
+                        inv_id,
+                        inv_attachment["path_to_attachment"],
+                        inv_attachment.get("description", ""),
+                    ),
                 )
+                for inv_attachment in invoice_attachments
+            )
+        )
+        return [failure for result in results for failure in result]
 
-    def _process_credit_notes(
-        self, credit_notes: List[Dict[str, Any]], tasks: Deque, claim_id: str
-    ) -> None:
-        for crn in credit_notes:
-            crn_response = self.submit_credit_note(claim_id, **crn)
+    async def _asubmit_invoice(
+        self, claim_id: str, invoice: Dict[str, Any]
+    ) -> List[FailedChild]:
+        fields = {
+            key: value for key, value in invoice.items() if key != "invoice_attachments"
+        }
+        try:
+            inv_response = await self.asubmit_invoices(claim=claim_id, **fields)
+            inv_id = inv_response["id"]
+        except Exception as e:
+            return [FailedChild("invoice", claim_id, invoice, e)]
+        return await self._asubmit_invoice_attachments(
+            inv_id, invoice.get("invoice_attachments", [])
+        )
+
+    async def _asubmit_credit_note(
+        self, claim_id: str, crn: Dict[str, Any]
+    ) -> List[FailedChild]:
+        fields = {key: value for key, value in crn.items() if key != "crn_attachments"}
+        try:
+            crn_response = await self.asubmit_credit_note(claim_id, **fields)
             crn_id = crn_response["id"]
-            for crn_attachment in crn.get("crn_attachments", []):
-                tasks.append(
-                    (
-                        self.submit_invoice_attachment,
-                        (
-                            crn_id,
-                            crn_attachment["path_to_attachment"],
-                            crn_attachment.get("description", ""),
-                        ),
-                    )
-                )
+        except Exception as e:
+            return [FailedChild("credit_note", claim_id, crn, e)]
+        return await self._asubmit_invoice_attachments(
+            crn_id, crn.get("crn_attachments", [])
+        )
 
-    def send_a_claim_and_its_children(self, bundled_claim: Dict[str, Any]) -> None:
+    async def asend_a_claim_and_its_children(
+        self, bundled_claim: Dict[str, Any]
+    ) -> None:
         """
         Sends an individual claim, along with its invoices, credit notes, and attachments.
+
         :param bundled_claim: A dictionary containing the claim,
             its invoices, credit notes, and related attachments.
+        :raises ClaimSubmissionError: If the claim was created but any of its
+            children failed; every other child is still submitted.
         """
         invoices: List[Dict[str, Any]] = bundled_claim.pop("invoices", [])
         claim_attachments: List[Dict[str, Any]] = bundled_claim.pop(
@@ -145,13 +515,14 @@ class Slade360(Visit, Claim, Invoice, CreditNote, Remittance):
         )
         credit_notes: List[Dict[str, Any]] = bundled_claim.pop("credit_notes", [])
 
-        claim_resp = self.create_claim(**bundled_claim)
+        claim_resp = await self.acreate_claim(**bundled_claim)
         claim_id = claim_resp["id"]
 
-        tasks = deque()
-
-        self._process_claim_attachments(claim_attachments, tasks, claim_id)
-        self._process_invoices(invoices, tasks, claim_id)
-        self._process_credit_notes(credit_notes, tasks, claim_id)
-
-        self._process_tasks(tasks)
+        results = await asyncio.gather(
+            self._asubmit_claim_attachments(claim_id, claim_attachments),
+            *(self._asubmit_invoice(claim_id, invoice) for invoice in invoices),
+            *(self._asubmit_credit_note(claim_id, crn) for crn in credit_notes),
+        )
+        failures = [failure for result in results for failure in result]
+        if failures:
+            raise ClaimSubmissionError(claim_id, failures) from failures[0].error
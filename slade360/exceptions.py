@@ -0,0 +1,70 @@
+from typing import Any, Dict, List, NamedTuple
+
+
+class FailedChild(NamedTuple):
+    """
+    A child of a claim (invoice, credit note or attachment) that could not be submitted.
+
+    :param kind: One of "claim_attachment", "invoice", "credit_note" or
+        "invoice_attachment" (which also covers credit note attachments).
+    :param parent_id: ID of the claim, invoice or credit note the child belongs to.
+    :param child: The child exactly as it appeared in the bundled claim, so it can
+        be resubmitted as-is.
+    :param error: The exception raised while submitting it.
+    """
+
+    kind: str
+    parent_id: str
+    child: Dict[str, Any]
+    error: Exception
+
+
+class ClaimSubmissionError(Exception):
+    """
+    Raised when a claim was created but some of its children failed to submit.
+
+    The claim itself exists, so callers should resubmit only the children listed
+    in `failures` rather than the whole bundle.
+    """
+
+    def __init__(self, claim_id: str, failures: List[FailedChild]) -> None:
+        self.claim_id = claim_id
+        self.failures = failures
+        details = "; ".join(
+            f"{failure.kind} of {failure.parent_id}: {failure.error!r}"
+            for failure in failures
+        )
+        super().__init__(
+            f"{len(failures)} child submission(s) failed for claim {claim_id}: {details}"
+        )
+
+
+class FailedClaim(NamedTuple):
+    """
+    A claim from a bulk submission that was not fully submitted.
+
+    :param claim: The bundled claim exactly as it was passed in, children included.
+    :param error: The exception raised while sending it. A `ClaimSubmissionError`
+        means the claim was created and only the children it lists failed; any
+        other exception means the claim itself was not created.
+    """
+
+    claim: Dict[str, Any]
+    error: Exception
+
+
+class BulkSubmissionError(Exception):
+    """
+    Raised when claims in a bulk submission failed.
+
+    Claims not listed in `failures` were submitted in full, so callers should
+    resubmit only those that are.
+    """
+
+    def __init__(self, failures: List[FailedClaim]) -> None:
+        self.failures = failures
+        details = "; ".join(
+            f"visit {failure.claim.get('visit_number')}: {failure.error!r}"
+            for failure in failures
+        )
+        super().__init__(f"{len(failures)} claim submission(s) failed: {details}")
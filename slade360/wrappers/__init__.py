@@ -1,10 +1,114 @@
-from datetime import datetime, timedelta
-from typing import Any, Dict
+import json
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
-class Authentication:
+LOGGER = logging.getLogger(__name__)
+
+# Refresh the access token this many seconds before the server-side expiry so
+# that requests never race a token that is about to lapse.
+TOKEN_REFRESH_MARGIN = 300
+
+# After a failed background refresh, wait at least this long before trying
+# again, doubling the wait on each further failure.
+TOKEN_REFRESH_RETRY_MIN = 30
+
+# A persisted token is only reused if it stays valid for at least this long.
+TOKEN_CACHE_MIN_TTL = 60
+
+# Connection pool sizing for the shared session. The pool is kept large enough
+# for every worker thread to hold a keep-alive connection to each host.
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 50
+
+
+def _dumps_json(payload: Any) -> bytes:
+    """
+    Serializes a request payload to compact JSON, using orjson when installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+class _PostSafeRetry(Retry):
+    """
+    Retry policy that never resends a POST the server may have processed.
+
+    GETs are retried on every status in `status_forcelist` and on read errors.
+    POSTs are only retried on connection errors and on statuses in
+    POST_RETRY_STATUSES, which mean the request was turned away unprocessed;
+    resending after anything else could submit a claim or invoice twice.
+    """
+
+    POST_RETRY_STATUSES = frozenset([429, 503])
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method == "POST" and status_code not in self.POST_RETRY_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method: Optional[str] = None, *args, **kwargs) -> Retry:
+        if method == "POST" and self.read is not False:
+            # Re-raise read errors rather than retrying them
+            return self.new(read=False).increment(method, *args, **kwargs)
+        return super().increment(method, *args, **kwargs)
+
+
+class _EndpointURLs:
+    """
+    Builds the endpoint URLs from the base URLs once per client, rather than
+    formatting them again on every request.
+    """
+
+    base_edi_url: str
+    base_is_url: str
+
+    def _cache_endpoint_urls(self) -> None:
+        edi_url, is_url = self.base_edi_url, self.base_is_url
+
+        # EDI
+        self._url_member_eligibility = f"{edi_url}/v1/beneficiaries/member_eligibility"
+        self._url_beneficiary_contacts = (
+            f"{edi_url}/v1/beneficiaries/beneficiary_contacts"
+        )
+        self._url_balance_reservations = (
+            f"{edi_url}/v1/balances/reservations/reserve_from_authorization/"
+        )
+        self._url_remittances = f"{edi_url}/v1/remittances"
+        self._url_claim_remittance = f"{edi_url}/v1/remittances/claim_remittance"
+
+        # Integration Services
+        self._url_start_visit = f"{is_url}/v1/authorizations/start_visit/"
+        self._url_validate_authorization_token = (
+            f"{is_url}/v1/authorizations/validate_authorization_token/"
+        )
+        self._url_claims = f"{is_url}/v1/claims/"
+        self._url_claim_attachments = (
+            f"{is_url}/v1/claim_attachments/upload_attachment/"
+        )
+        self._url_invoices = f"{is_url}/v1/invoices"
+        self._url_invoice_attachments = (
+            f"{is_url}/v1/invoice_attachments/upload_attachment/"
+        )
+
+
+class Authentication(_EndpointURLs):
     """
     Handles OAuth 2.0-based authentication for accessing APIs on the HealthCloud platform.
 
@@ -24,6 +128,8 @@ class Authentication:
         base_edi_url: str,
         base_is_url: str,
         grant_type: str = "password",
+        pool_maxsize: Optional[int] = None,
+        token_cache_path: Optional[str] = None,
     ) -> None:
         """
         Initializes the authentication class by setting up necessary credentials
@@ -37,11 +143,33 @@ class Authentication:
         :param base_edi_url: The base URL of the EDI system.
         :param base_is_url: The base URL of the Integration Services system.
         :param grant_type: The OAuth grant type for requesting an access token (default is "password").
+        :param pool_maxsize: Maximum number of pooled connections kept per host
+            (default is DEFAULT_POOL_MAXSIZE).
+        :param token_cache_path: Optional file in which the access token is persisted,
+            so that later instances (e.g. successive CLI runs) can reuse it until it
+            expires instead of authenticating again. The file is readable by its
+            owner only.
         """
         self.base_auth_url = base_auth_url
         self.base_edi_url = base_edi_url
         self.base_is_url = base_is_url
+        self._cache_endpoint_urls()
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=pool_maxsize or DEFAULT_POOL_MAXSIZE,
+            max_retries=_PostSafeRetry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"]),
+                respect_retry_after_header=True,
+                # Hand the final response to raise_for_status once retries run out
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.token_url = f"{self.base_auth_url}/oauth2/token/"
         self.auth_payload = {
             "grant_type": grant_type,
@@ -50,7 +178,22 @@ class Authentication:
             "username": username,
             "password": password,
         }
-        self.authenticate()
+        self.token_cache_path = token_cache_path
+        self._auth_lock = threading.Lock()
+        self._closed = threading.Event()
+        if not self._load_cached_token():
+            self.authenticate()
+
+        # The refresher only holds a weak reference, so a client that is never
+        # closed can still be garbage-collected; collecting it stops the thread.
+        weakref.finalize(self, self._closed.set)
+        self._refresher = threading.Thread(
+            target=self._refresh_loop,
+            args=(weakref.ref(self), self._closed),
+            name="slade-token-refresher",
+            daemon=True,
+        )
+        self._refresher.start()
 
     def authenticate(self) -> None:
         """
@@ -72,34 +215,261 @@ class Authentication:
         expires_in = response_content.get(
             "expires_in", 3600
         )  # Default to 1 hour if not provided
-        self.session_expiry = datetime.now() + timedelta(seconds=expires_in)
+        self._install_token(response_content["access_token"], expires_in)
+        self._save_cached_token(response_content["access_token"], expires_in)
+
+    def _install_token(self, access_token: str, expires_in: float) -> None:
+        refresh_margin = min(TOKEN_REFRESH_MARGIN, expires_in // 2)
+        lifetime_end = time.monotonic() + expires_in
+        expiry_monotonic = lifetime_end - refresh_margin
 
         # Update session headers to include the access token
         new_headers = {
-            "Authorization": f"Bearer {response_content['access_token']}",
+            "Authorization": f"Bearer {access_token}",
             "Accept": "*/*",
             "Content-Type": "application/json",
         }
         self.session.headers.update(new_headers)
 
+        # Invoices and credit notes are the most frequent POSTs in a bulk run.
+        # Prepare their URL, headers and environment settings once per token.
+        # Cookies are left out of the template: the session jar can change
+        # between sends, so they are attached to each copy instead.
+        self._invoice_template = self.session.prepare_request(
+            requests.Request("POST", self._url_invoices)
+        )
+        self._invoice_template.headers.pop("Cookie", None)
+        self._invoice_send_settings = self.session.merge_environment_settings(
+            self._url_invoices, {}, None, None, None
+        )
+
+        # Publish the new expiry last: threads that read it without the lock
+        # must only see it once the token it belongs to is fully installed.
+        # `_expiry_monotonic` is when the token is due for refresh, and
+        # `_lifetime_end_monotonic` when the server stops accepting it.
+        self._lifetime_end_monotonic = lifetime_end
+        self._expiry_monotonic = expiry_monotonic
+
+    def _load_cached_token(self) -> bool:
+        """
+        Installs the access token persisted at `token_cache_path`, if any.
+
+        The token is only reused if it was issued by the same token endpoint for
+        the same client and user, and remains valid for at least TOKEN_CACHE_MIN_TTL seconds.
+
+        :return: True if a cached token was installed, False otherwise.
+        """
+        if not self.token_cache_path:
+            return False
+
+        try:
+            with open(self.token_cache_path) as cache_file:
+                cached = json.load(cache_file)
+            if (
+                cached["token_url"] != self.token_url
+                or cached["client_id"] != self.auth_payload["client_id"]
+                or cached["username"] != self.auth_payload["username"]
+            ):
+                return False
+            access_token = cached["access_token"]
+            expires_in = cached["expires_at"] - time.time()
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+        if expires_in < TOKEN_CACHE_MIN_TTL:
+            return False
+
+        self._install_token(access_token, expires_in)
+        return True
+
+    def _save_cached_token(self, access_token: str, expires_in: float) -> None:
+        if not self.token_cache_path:
+            return
+
+        cached = {
+            "token_url": self.token_url,
+            "client_id": self.auth_payload["client_id"],
+            "username": self.auth_payload["username"],
+            "access_token": access_token,
+            "expires_at": time.time() + expires_in,
+        }
+        tmp_path = f"{self.token_cache_path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as cache_file:
+                json.dump(cached, cache_file)
+            os.replace(tmp_path, self.token_cache_path)
+        except OSError as e:
+            LOGGER.warning(f"Could not persist access token: {e}")
+
+    def close(self) -> None:
+        """
+        Stops the background token refresh and closes the HTTP session.
+        """
+        self._closed.set()
+        self.session.close()
+
+    def __enter__(self) -> "Authentication":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _refresh_loop(
+        client_ref: "weakref.ref[Authentication]", closed: threading.Event
+    ) -> None:
+        """
+        Proactively refreshes the access token shortly before it expires.
+
+        Runs on a daemon thread so that callers never pay for a token refresh
+        in the middle of a request. The sleep is jittered to avoid many clients
+        refreshing in lockstep. Inline refresh in `_make_request` remains as a
+        fallback should a background refresh fail.
+
+        Failed refreshes are retried with exponential backoff from
+        TOKEN_REFRESH_RETRY_MIN seconds, capped at the token's remaining
+        lifetime. Once the token has expired, the loop stops refreshing and
+        leaves it to the inline fallback, resuming when a new token arrives.
+
+        The client is only dereferenced while it is in use, and the loop exits
+        once the client is closed or garbage-collected.
+        """
+        failed_refreshes = 0
+        while True:
+            client = client_ref()
+            if client is None:
+                return
+            now = time.monotonic()
+            expiry = client._expiry_monotonic
+            remaining = expiry - now
+            lifetime = client._lifetime_end_monotonic - now
+            del client
+
+            if lifetime <= 0:
+                # Only check back now and then for a token refreshed inline
+                failed_refreshes = 0
+                delay = TOKEN_REFRESH_RETRY_MIN
+            elif failed_refreshes:
+                backoff = TOKEN_REFRESH_RETRY_MIN * 2 ** (failed_refreshes - 1)
+                delay = max(1, min(backoff, lifetime)) * random.uniform(0.9, 1.0)
+            else:
+                delay = max(1, remaining) * random.uniform(0.9, 1.0)
+
+            if closed.wait(delay):
+                return
+
+            client = client_ref()
+            if client is None:
+                return
+            if time.monotonic() >= client._lifetime_end_monotonic:
+                continue
+            try:
+                with client._auth_lock:
+                    # Skip if the token was replaced inline or after a 401
+                    # while this thread slept
+                    if client._expiry_monotonic <= expiry:
+                        client.authenticate()
+                failed_refreshes = 0
+            except Exception as e:
+                failed_refreshes += 1
+                LOGGER.warning(f"Background token refresh failed: {e}")
+
+    def _refresh_token_if_expired(self) -> None:
+        # Double-checked: the lock is only taken once the token is due, and only
+        # the first thread through it refreshes; the others find it renewed.
+        if time.monotonic() >= self._expiry_monotonic:
+            with self._auth_lock:
+                if time.monotonic() >= self._expiry_monotonic:
+                    self.authenticate()
+
+    def _resend_if_unauthorized(self, response: requests.Response) -> requests.Response:
+        """
+        Re-authenticates once and resends a request rejected with a 401.
+
+        A token can be revoked before it expires, e.g. one reloaded from
+        `token_cache_path` after the user's credentials changed. The prepared
+        request is resent as-is with the new token, so uploads are not re-read.
+
+        :param response: The response to the original request.
+        :return: The response to the resent request, or `response` itself if it
+            was not a 401.
+        """
+        if response.status_code != 401:
+            return response
+
+        rejected = response.request.headers.get("Authorization")
+        with self._auth_lock:
+            # Another thread may already have replaced the rejected token
+            if self.session.headers.get("Authorization") == rejected:
+                self.authenticate()
+
+        request = response.request.copy()
+        request.headers["Authorization"] = self.session.headers["Authorization"]
+        settings = self.session.merge_environment_settings(
+            request.url, {}, None, None, None
+        )
+        return self.session.send(request, **settings)
+
+    def _send_invoice(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POSTs an invoice or credit note payload using the prepared invoice request.
+
+        Skips the URL, header and environment merging that `_make_request` does
+        on every call. Keys whose value is None are left out, as in `_make_request`.
+
+        :param payload: The invoice or credit note payload.
+        :return: The JSON response from the API.
+        :raises HTTPError: If the API request fails.
+        """
+        self._refresh_token_if_expired()
+
+        request = self._invoice_template.copy()
+        request.prepare_cookies(self.session.cookies)
+        request.prepare_body(
+            data=_dumps_json(
+                {key: value for key, value in payload.items() if value is not None}
+            ),
+            files=None,
+        )
+        response = self.session.send(request, **self._invoice_send_settings)
+        response = self._resend_if_unauthorized(response)
+        response.raise_for_status()
+        return response.json()
+
     def _make_request(self, request_method: str, **kwargs) -> Dict[str, Any]:
         """
         Makes an authenticated API request using the provided HTTP method.
 
-        Automatically refreshes the access token if it has expired.
+        Automatically refreshes the access token if it has expired, and
+        re-authenticates once if the server rejects it.
+
+        Keys of a `json` payload whose value is None are left out. The payload is
+        encoded as JSON, or sent as multipart form fields alongside `files`.
 
         :param request_method: The HTTP method to use (e.g., "GET", "POST" etc.).
         :param kwargs: Additional arguments to pass to the `requests.request` method.
         :return: The JSON response from the API.
         :raises HTTPError: If the API request fails.
         """
-        # Refresh token if expired
-        if datetime.now() > self.session_expiry:
-            self.authenticate()
+        self._refresh_token_if_expired()
+
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            payload = {
+                key: value for key, value in payload.items() if value is not None
+            }
+            if "files" in kwargs:
+                # Let requests set the multipart Content-Type and boundary
+                kwargs["data"] = payload
+                kwargs["headers"] = {"Content-Type": None}
+            else:
+                kwargs["data"] = _dumps_json(payload)
 
         # Make the API request
         response: requests.Response = self.session.request(
             method=request_method, **kwargs
         )
+        response = self._resend_if_unauthorized(response)
         response.raise_for_status()
         return response.json()
@@ -0,0 +1,306 @@
+import asyncio
+import time
+from typing import Any, Dict, List, Literal, Optional
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+
+from slade360.wrappers import TOKEN_REFRESH_MARGIN, _dumps_json, _EndpointURLs
+from slade360.wrappers.submit_visits import _CREDIT_NOTE_BASE, _open_attachment
+
+# Connection limits for the shared async client
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+
+# Headers that never change, built once rather than per request
+_CLIENT_HEADERS = {"Accept": "*/*"}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class AsyncAuthentication(_EndpointURLs):
+    """
+    asyncio counterpart of `Authentication`, backed by `httpx.AsyncClient`.
+
+    The client is bound to the running event loop, so it is opened and
+    authenticated on entering the instance as an async context manager
+    rather than in `__init__`:
+
+    >>> async with AsyncSlade360(**credentials) as slade:
+    ...     await slade.acreate_claim(**claim)
+
+    https://healthcloud.sh/api-reference#tag/API_AUTHORIZATION
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        username: str,
+        password: str,
+        base_auth_url: str,
+        base_edi_url: str,
+        base_is_url: str,
+        grant_type: str = "password",
+    ) -> None:
+        """
+        Stores the credentials used to authenticate once the client is opened.
+
+        Takes the same arguments as `Authentication`.
+
+        :raises ImportError: If httpx is not installed.
+        """
+        if httpx is None:
+            raise ImportError(
+                "The async client requires httpx. "
+                "Install it with `pip install slade360[async]`."
+            )
+
+        self.base_auth_url = base_auth_url
+        self.base_edi_url = base_edi_url
+        self.base_is_url = base_is_url
+        self._cache_endpoint_urls()
+        self.token_url = f"{self.base_auth_url}/oauth2/token/"
+        self.auth_payload = {
+            "grant_type": grant_type,
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "username": username,
+            "password": password,
+        }
+        self.client: Optional["httpx.AsyncClient"] = None
+        self._expiry_monotonic = 0.0
+
+    async def __aenter__(self) -> "AsyncAuthentication":
+        # HTTP/2 multiplexes every request over one connection per host. It
+        # needs the h2 package; without it httpx falls back to HTTP/1.1.
+        self.client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=_CLIENT_HEADERS,
+            limits=httpx.Limits(
+                max_connections=DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        self._auth_lock = asyncio.Lock()
+        await self.authenticate()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.client.aclose()
+        self.client = None
+
+    async def authenticate(self) -> None:
+        """
+        Retrieves an access token and installs it on the client headers.
+
+        https://healthcloud.sh/api-reference#tag/API_AUTHORIZATION/operation/get_access_token
+        """
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        response = await self.client.post(
+            self.token_url, data=self.auth_payload, headers=headers
+        )
+        response.raise_for_status()
+
+        response_content = response.json()
+        expires_in = response_content.get("expires_in", 3600)
+        refresh_margin = min(TOKEN_REFRESH_MARGIN, expires_in // 2)
+        self._expiry_monotonic = time.monotonic() + expires_in - refresh_margin
+
+        self.client.headers["Authorization"] = (
+            f"Bearer {response_content['access_token']}"
+        )
+
+    async def _make_request(self, request_method: str, **kwargs) -> Dict[str, Any]:
+        """
+        Makes an authenticated API request, refreshing the token if it has expired.
+
+        Keys of a `json` payload whose value is None are left out, as in
+        `Authentication._make_request`.
+
+        :param request_method: The HTTP method to use (e.g., "GET", "POST" etc.).
+        :param kwargs: Additional arguments to pass to `httpx.AsyncClient.request`.
+        :return: The JSON response from the API.
+        :raises HTTPStatusError: If the API request fails.
+        """
+        if time.monotonic() >= self._expiry_monotonic:
+            async with self._auth_lock:
+                if time.monotonic() >= self._expiry_monotonic:
+                    await self.authenticate()
+
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            payload = {
+                key: value for key, value in payload.items() if value is not None
+            }
+            if "files" in kwargs:
+                kwargs["data"] = payload
+            else:
+                kwargs["content"] = _dumps_json(payload)
+                kwargs["headers"] = _JSON_HEADERS
+
+        response = await self.client.request(request_method, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+
+class AsyncClaim:
+    """
+    asyncio counterpart of `Claim`.
+
+    https://healthcloud.sh/api-reference#tag/CLAIMS
+    """
+
+    async def acreate_claim(
+        self,
+        payer_code: int,
+        payer_name: str,
+        patient_name: str,
+        member_number: str,
+        scheme_name: str,
+        visit_number: str,
+        visit_start: str,
+        visit_end: str,
+        icd10_codes: List[Dict[str, str]],
+        location_code: Optional[str] = None,
+        location_name: Optional[str] = None,
+        scheme_code: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a medical claim for a member. See `Claim.create_claim`.
+        """
+        url = self._url_claims
+        payload = {
+            "payer_code": payer_code,
+            "payer_name": payer_name,
+            "patient_name": patient_name,
+            "member_number": member_number,
+            "scheme_name": scheme_name,
+            "visit_number": visit_number,
+            "visit_start": visit_start,
+            "visit_end": visit_end,
+            "icd10_codes": icd10_codes,
+            "location_code": location_code,
+            "location_name": location_name,
+            "scheme_code": scheme_code,
+        }
+
+        return await self._make_request(request_method="POST", url=url, json=payload)
+
+    async def asubmit_claim_attachment(
+        self,
+        claim: str,
+        path_to_attachment: str,
+        attachment_type: Literal[
+            "CLAIM_FORM",
+            "PREAUTH_FORM",
+            "PRESCRIPTION",
+            "LAB_ORDER",
+            "IMAGING_ORDER",
+            "OTHER",
+        ],
+        description: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Submit an attachment for a specific claim. See `Claim.submit_claim_attachment`.
+        """
+        url = self._url_claim_attachments
+
+        with _open_attachment(path_to_attachment) as attachment:
+            files = {"attachment": attachment}
+            payload = {
+                "claim": claim,
+                "attachment_type": attachment_type,
+                "description": description,
+            }
+
+            return await self._make_request(
+                request_method="POST", url=url, files=files, json=payload
+            )
+
+
+class AsyncInvoice:
+    """
+    asyncio counterpart of `Invoice`.
+
+    https://healthcloud.sh/api-reference#tag/INVOICES
+    """
+
+    async def asubmit_invoices(
+        self,
+        claim: str,
+        invoice_number: str,
+        invoice_date: str,
+        lines: List[Dict[str, Any]],
+        copays: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Submit an invoice for a medical claim. See `Invoice.submit_invoices`.
+        """
+        url = self._url_invoices
+        payload = {
+            "claim": claim,
+            "invoice_number": invoice_number,
+            "invoice_date": invoice_date,
+            "lines": lines,
+            "copays": copays or [],
+        }
+
+        return await self._make_request(request_method="POST", url=url, json=payload)
+
+    async def asubmit_invoice_attachment(
+        self, invoice: str, path_to_attachment: str, description: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Submit an attachment for a specific invoice. See `Invoice.submit_invoice_attachment`.
+        """
+        url = self._url_invoice_attachments
+
+        with _open_attachment(path_to_attachment) as attachment:
+            files = {"attachment": attachment}
+            payload = {
+                "invoice": invoice,
+                "description": description,
+            }
+
+            return await self._make_request(
+                request_method="POST", url=url, files=files, json=payload
+            )
+
+
+class AsyncCreditNote:
+    """
+    asyncio counterpart of `CreditNote`.
+
+    https://healthcloud.sh/api-reference#tag/CREDIT_NOTES
+    """
+
+    async def asubmit_credit_note(
+        self,
+        claim: str,
+        invoice_number: str,
+        invoice_date: str,
+        lines: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Submit a credit note to correct an overcharge on a claim.
+        See `CreditNote.submit_credit_note`.
+        """
+        url = self._url_invoices
+        payload = {
+            **_CREDIT_NOTE_BASE,
+            "claim": claim,
+            "invoice_number": invoice_number,
+            "invoice_date": invoice_date,
+            "lines": lines,
+        }
+
+        return await self._make_request(request_method="POST", url=url, json=payload)
@@ -1,9 +1,7 @@
 from typing import Any, Dict
 
-from slade360.wrappers import Authentication
 
-
-class Remittance(Authentication):
+class Remittance:
     """
     Remittances are a collection of individual payments for a set of claims.
     A single claim can be associated with multiple remittances and a single remittance
@@ -18,8 +16,7 @@ class Remittance(Authentication):
 
         https://healthcloud.sh/api-reference#tag/REMITTANCE/operation/list_remittances
         """
-        url = f"{self.base_edi_url}/v1/remittances"
-        return self._make_request(request_method="GET", url=url)
+        return self._make_request(request_method="GET", url=self._url_remittances)
 
     def get_remittance(self, claim_remittance_id: int) -> Dict[str, Any]:
         """
@@ -27,7 +24,7 @@ class Remittance(Authentication):
 
         :parmam claim_remittance_id (int): claim id referencing the ClaimRemittance
         """
-        url = f"{self.base_edi_url}/v1/remittances/claim_remittance"
+        url = self._url_claim_remittance
         payload = {"claim_id": claim_remittance_id}
 
         return self._make_request(request_method="GET", url=url, json=payload)
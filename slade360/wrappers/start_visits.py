@@ -1,15 +1,30 @@
+import copy
+import threading
 from typing import Any, Dict, List, Literal, Optional, Union
 
-from slade360.wrappers import Authentication
+from cachetools import TTLCache
+from cachetools.keys import hashkey
 
+# Eligibility lookups are cached briefly, since a member is often looked up
+# several times over the course of one visit.
+MEMBER_ELIGIBILITY_CACHE_SIZE = 1024
+MEMBER_ELIGIBILITY_CACHE_TTL = 60
 
-class Visit(Authentication):
+
+class Visit:
     """
     The Visit class handles various visit-related functionalities for
     interacting with member insurance details, starting a visit, and managing
     authorizations via the HealthCloud API.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        self._eligibility_cache: TTLCache = TTLCache(
+            maxsize=MEMBER_ELIGIBILITY_CACHE_SIZE, ttl=MEMBER_ELIGIBILITY_CACHE_TTL
+        )
+        self._eligibility_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
     def get_member_eligibility(
         self,
         member_number: str,
@@ -18,6 +33,9 @@ class Visit(Authentication):
         """
         Retrieve medical cover details for a specific member under a given insurer/payer.
 
+        Successful responses are cached for MEMBER_ELIGIBILITY_CACHE_TTL seconds.
+        Each call returns its own copy, so callers may modify it freely.
+
         :param member_number: Member number printed on the insurance card.
         :param payer_slade_code: The insurer's identifier on Slade.
 
@@ -25,16 +43,27 @@ class Visit(Authentication):
 
         https://healthcloud.sh/api-reference#tag/MEMBER_ELIGIBILITY
         """
+        key = hashkey(member_number, payer_slade_code)
+        with self._eligibility_lock:
+            eligibility = self._eligibility_cache.get(key)
+        if eligibility is not None:
+            return copy.deepcopy(eligibility)
+
         eligibility_params = {
             "member_number": member_number,
             "payer_slade_code": payer_slade_code,
         }
-        eligibility_resource = "/v1/beneficiaries/member_eligibility"
-
-        return self._make_request(
-            request_method="GET", url=eligibility_resource, params=eligibility_params
+        eligibility = self._make_request(
+            request_method="GET",
+            url=self._url_member_eligibility,
+            params=eligibility_params,
         )
 
+        if "error" not in eligibility:
+            with self._eligibility_lock:
+                self._eligibility_cache[key] = copy.deepcopy(eligibility)
+        return eligibility
+
     def request_otp(self, contact_id: int) -> None:
         """
         Request an OTP to be sent to the member's registered phone number.
@@ -44,8 +73,7 @@ class Visit(Authentication):
 
         https://healthcloud.sh/api-reference#tag/MEMBER_AUTHENTICATION
         """
-        resource = f"/v1/beneficiaries/beneficiary_contacts/{contact_id}/send_otp/"
-        otp_url = f"{self.base_edi_url}{resource}"
+        otp_url = f"{self._url_beneficiary_contacts}/{contact_id}/send_otp/"
 
         self._make_request(request_method="POST", url=otp_url)
 
@@ -80,7 +108,7 @@ class Visit(Authentication):
 
         https://healthcloud.sh/api-reference#tag/START_VISIT/operation/start_visit_via_otp
         """
-        url = f"{self.base_is_url}/v1/authorizations/start_visit/"
+        url = self._url_start_visit
         payload = {
             "beneficiary_id": beneficiary_id,
             "factors": factors,
@@ -124,7 +152,7 @@ class Visit(Authentication):
 
         https://healthcloud.sh/api-reference#tag/START_VISIT/operation/validate_authorization_token
         """
-        url = f"{self.base_is_url}/v1/authorizations/validate_authorization_token/"
+        url = self._url_validate_authorization_token
         payload = {
             "first_name": first_name,
             "last_name": last_name,
@@ -152,9 +180,7 @@ class Visit(Authentication):
 
         https://healthcloud.sh/api-reference#tag/BALANCE_RESERVATION/operation/create_balance_reservation
         """
-        url = (
-            f"{self.base_edi_url}/v1/balances/reservations/reserve_from_authorization/"
-        )
+        url = self._url_balance_reservations
         payload = {
             "authorization": authorization,
             "invoice_number": invoice_number,
@@ -1,10 +1,26 @@
-import os
-from typing import Any, Dict, List, Literal, Optional, Union
+from types import MappingProxyType
+from typing import IO, Any, Dict, List, Literal, Optional
 
-from slade360.wrappers import Authentication
+# Fields shared by every credit note payload
+_CREDIT_NOTE_BASE = MappingProxyType({"invoice_type": "CREDIT_NOTE"})
 
 
-class Claim(Authentication):
+def _open_attachment(path_to_attachment: str) -> IO[bytes]:
+    """
+    Opens an attachment for upload.
+
+    :param path_to_attachment: Path to the file to be uploaded.
+    :raises FileNotFoundError: If the file does not exist.
+    """
+    try:
+        return open(path_to_attachment, "rb")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            f"Attachment file '{path_to_attachment}' not found."
+        ) from e
+
+
+class Claim:
     """
     Handles medical claim creation and attachment submission processes.
 
@@ -46,7 +62,7 @@ class Claim(Authentication):
         :param scheme_code (Optional[str]): Member scheme code. Defaults to None.
         :return (Dict[str, Any]): JSON response containing the created claim details.
         """
-        url = f"{self.base_is_url}/v1/claims/"
+        url = self._url_claims
         payload = {
             "payer_code": payer_code,
             "payer_name": payer_name,
@@ -87,15 +103,9 @@ class Claim(Authentication):
         :param description (Optional[str]): Optional description for the attachment.
         :return (Dict[str, Any]): JSON response containing attachment details.
         """
-        resource_url = "/v1/claim_attachments/upload_attachment/"
-        url = f"{self.base_is_url}{resource_url}"
+        url = self._url_claim_attachments
 
-        if not os.path.exists(path_to_attachment):
-            raise FileNotFoundError(
-                f"Attachment file '{path_to_attachment}' not found."
-            )
-
-        with open(path_to_attachment, "rb") as attachment:
+        with _open_attachment(path_to_attachment) as attachment:
             files = {"attachment": attachment}
             payload = {
                 "claim": claim,
@@ -108,7 +118,7 @@ class Claim(Authentication):
             )
 
 
-class Invoice(Authentication):
+class Invoice:
     """
     Handles invoice creation, submission, and attachments for claims.
 
@@ -133,7 +143,6 @@ class Invoice(Authentication):
         :param copays (Optional[List[Dict[str, Any]]]): Optional list of copay details. Defaults to None.
         :return (Dict[str, Any]): JSON response containing the submitted invoice details.
         """
-        url = f"{self.base_is_url}/v1/invoices"
         payload = {
             "claim": claim,
             "invoice_number": invoice_number,
@@ -142,7 +151,7 @@ class Invoice(Authentication):
             "copays": copays or [],  # Use an empty list if copays is None
         }
 
-        return self._make_request(request_method="POST", url=url, json=payload)
+        return self._send_invoice(payload)
 
     def submit_invoice_attachment(
         self, invoice: str, path_to_attachment: str, description: Optional[str] = None
@@ -155,15 +164,9 @@ class Invoice(Authentication):
         :param description (Optional[str]): Optional description for the attachment.
         :return (Dict[str, Any]): JSON response containing attachment details.
         """
-        resource_url = "/v1/invoice_attachments/upload_attachment/"
-        url = f"{self.base_is_url}{resource_url}"
+        url = self._url_invoice_attachments
 
-        if not os.path.exists(path_to_attachment):
-            raise FileNotFoundError(
-                f"Attachment file '{path_to_attachment}' not found."
-            )
-
-        with open(path_to_attachment, "rb") as attachment:
+        with _open_attachment(path_to_attachment) as attachment:
             files = {"attachment": attachment}
             payload = {
                 "invoice": invoice,
@@ -175,7 +178,7 @@ class Invoice(Authentication):
             )
 
 
-class CreditNote(Authentication):
+class CreditNote:
     """
     Handles submission of credit notes to correct overcharges for claims.
 
@@ -198,13 +201,12 @@ class CreditNote(Authentication):
         :param lines (List[Dict[str, Any]]): Specific billable line items for correction.
         :return (Dict[str, Any]): JSON response containing the submitted credit note details.
         """
-        url = f"{self.base_is_url}/v1/invoices"
         payload = {
-            "invoice_type": "CREDIT_NOTE",
+            **_CREDIT_NOTE_BASE,
             "claim": claim,
             "invoice_number": invoice_number,
             "invoice_date": invoice_date,
             "lines": lines,
         }
 
-        return self._make_request(request_method="POST", url=url, json=payload)
+        return self._send_invoice(payload)